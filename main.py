@@ -1,11 +1,23 @@
 # Cross-platform, Ctrl+C to stop. Interactive setup with auto-detected username.
 # Processes Imgur posts (Public + Hidden) in visual order (top-left first).
 
+import argparse
+import functools
 import json
+import os
+import queue
 import re
+import sys
+import threading
 import time
+import weakref
 from pathlib import Path
-from playwright.sync_api import sync_playwright, TimeoutError
+try:
+    import orjson  # Optional: C-accelerated JSON for large storage state files
+except ImportError:
+    orjson = None
+# Playwright is imported lazily inside the functions that drive the browser so
+# interactive setup (and aborting at the final prompt) doesn't pay its import cost.
 
 # ANSI colors (works in modern Windows Terminal/PowerShell, macOS, Linux).
 # If not supported, the escapes will be ignored by the terminal.
@@ -27,16 +39,40 @@ def find_storage_files():
             candidates.append(name)
     return candidates
 
+def json_loads(data):
+    """Parse JSON bytes/str, using orjson when installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj):
+    """Serialize obj as indented JSON text, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+@functools.lru_cache(maxsize=8)
+def _parse_storage_file(path, mtime_ns):
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+def load_storage_state(storage_file):
+    """
+    Parsed storage state JSON, read from disk at most once per file version.
+    The cache is keyed on mtime so a re-login (which rewrites the file) is picked up.
+    """
+    return _parse_storage_file(storage_file, os.stat(storage_file).st_mtime_ns)
+
+ORIGIN_USER_PAT = re.compile(r"https://([^.]+)\.imgur\.com")
+COOKIE_DOMAIN_PAT = re.compile(r"([^.]+)\.imgur\.com")
+
 def extract_username_from_storage(storage_file):
     """Extract username from storage state JSON."""
     try:
-        with open(storage_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_storage_state(storage_file)
         
         # Check origins for username pattern (e.g., "https://username.imgur.com")
         for origin_data in data.get("origins", []):
             origin = origin_data.get("origin", "")
-            match = re.search(r"https://([^.]+)\.imgur\.com", origin)
+            match = ORIGIN_USER_PAT.search(origin)
             if match:
                 return match.group(1)
         
@@ -44,7 +80,7 @@ def extract_username_from_storage(storage_file):
         for cookie in data.get("cookies", []):
             domain = cookie.get("domain", "")
             if ".imgur.com" in domain:
-                match = re.search(r"([^.]+)\.imgur\.com", domain)
+                match = COOKIE_DOMAIN_PAT.search(domain)
                 if match:
                     username = match.group(1)
                     if username not in ("www", "i", "api", "m"):
@@ -57,10 +93,7 @@ def prompt_yes_no(prompt, default=False):
     """Interactive yes/no prompt."""
     default_text = "[Y/n]" if default else "[y/N]"
     while True:
-        try:
-            response = input(f"{prompt} {default_text}: ").strip().lower()
-        except KeyboardInterrupt:
-            raise  # Re-raise to be caught by main handler
+        response = input(f"{prompt} {default_text}: ").strip().lower()
         if not response:
             return default
         if response in ("y", "yes"):
@@ -72,10 +105,7 @@ def prompt_yes_no(prompt, default=False):
 def prompt_int(prompt, default, min_val=1, max_val=None):
     """Interactive integer prompt."""
     while True:
-        try:
-            response = input(f"{prompt} [{default}]: ").strip()
-        except KeyboardInterrupt:
-            raise  # Re-raise to be caught by main handler
+        response = input(f"{prompt} [{default}]: ").strip()
         if not response:
             return default
         try:
@@ -96,8 +126,8 @@ def load_config():
     """Load saved configuration if it exists."""
     if Path(CONFIG_FILE).exists():
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                return json_loads(f.read())
         except Exception:
             return None
     return None
@@ -113,21 +143,91 @@ def save_config(username, storage_file, dry_run, max_items, headless):
     }
     try:
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+            f.write(json_dumps(config))
         print(f"{GRN}✓ Configuration saved to '{CONFIG_FILE}'{RESET}\n")
     except Exception as e:
         print(f"{YEL}⚠ Could not save config: {e}{RESET}")
 
+HEADLESS_LAUNCH_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",  # don't decode images that routing missed (e.g. cache hits)
+)
+
+PROFILE_DIR = ".imgur_profile"   # persistent Chromium profile (cache, cookies, IndexedDB)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Resource types the deletion flow never looks at. Stylesheets stay allowed:
+# visibility checks and bounding boxes depend on the rendered layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+def block_heavy_resources(context):
+    """Abort image/media/font requests for every page in context."""
+    context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.continue_(),
+    )
+
+ORIGIN_SEED_KEY = "__autodelete_seed"
+# Runs before any page script. Copies the session file's localStorage for this origin
+# once per session-file version (tracked under ORIGIN_SEED_KEY), so a new login or a
+# copied file takes effect while values the site rewrites later are left alone.
+SEED_ORIGINS_JS = """(([seed, origins]) => {
+    const entry = origins.find(o => o.origin === location.origin);
+    if (!entry) return;
+    try {
+        if (localStorage.getItem('%s') === seed) return;
+        for (const {name, value} of entry.localStorage || []) localStorage.setItem(name, value);
+        localStorage.setItem('%s', seed);
+    } catch (e) {}
+})(%%s)""" % (ORIGIN_SEED_KEY, ORIGIN_SEED_KEY)
+
+def seed_session(context, storage_file):
+    """
+    Apply storage_file to context: cookies directly, localStorage ("origins") through
+    an init script, since a persistent context can't take storage_state.
+    """
+    state = load_storage_state(storage_file)
+    cookies = state.get("cookies", [])
+    if cookies:
+        context.add_cookies(cookies)
+    origins = state.get("origins", [])
+    if origins:
+        seed = str(os.stat(storage_file).st_mtime_ns)
+        context.add_init_script(script=SEED_ORIGINS_JS % json_dumps([seed, origins]))
+
+def launch_profile_context(p, storage_file=None, headless=False, args=None,
+                           block_resources=False, profile_dir=PROFILE_DIR, **context_options):
+    """
+    Launch Chromium on a persistent profile (PROFILE_DIR by default) so warm runs skip a cold start.
+    The session in storage_file (if given) is layered on top with seed_session(), so a
+    fresh login or a session file copied from another machine takes effect.
+    Returns (context, page).
+    """
+    context = p.chromium.launch_persistent_context(
+        profile_dir, headless=headless, args=args or [], **context_options
+    )
+    if block_resources:
+        block_heavy_resources(context)
+    if storage_file:
+        seed_session(context, storage_file)
+    page = context.pages[0] if context.pages else context.new_page()
+    return context, page
+
 def do_login(storage_file="imgur_storage_state.json"):
     """Perform interactive login and save session."""
     print(f"\n{BOLD}{BLU}╔══════════════════════════════════════════════════════════════╗{RESET}")
     print(f"{BOLD}{BLU}║              Imgur Login & Session Save                   ║{RESET}")
     print(f"{BOLD}{BLU}╚══════════════════════════════════════════════════════════════╝{RESET}\n")
     
+    from playwright.sync_api import sync_playwright
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
+        context, page = launch_profile_context(p, headless=False)
 
         print(f"{GRN}Opening Imgur sign-in page...{RESET}")
         page.goto("https://imgur.com/signin", wait_until="domcontentloaded")
@@ -143,13 +243,14 @@ def do_login(storage_file="imgur_storage_state.json"):
             input(f"{BLU}➡️  Press ENTER once you have finished logging in: {RESET}")
         except KeyboardInterrupt:
             print(f"\n\n{YEL}⛔ Login cancelled by user. Exiting.{RESET}")
-            browser.close()
+            context.close()
             return False
 
-        # Save cookies + localStorage to file
+        # The profile keeps the session for this machine; the file is still written
+        # for username detection and for copying the session to another machine.
         context.storage_state(path=storage_file)
         print(f"\n{GRN}✅ Session saved to '{storage_file}'.{RESET}")
-        browser.close()
+        context.close()
         return True
 
 def interactive_setup():
@@ -236,8 +337,6 @@ def interactive_setup():
                         print(f"{YEL}Invalid choice{RESET}")
                     except ValueError:
                         print(f"{YEL}Please enter a number{RESET}")
-                    except KeyboardInterrupt:
-                        raise  # Re-raise to be caught by main handler
     else:
         storage_file = storage_files[0]
         if len(storage_files) > 1:
@@ -253,8 +352,6 @@ def interactive_setup():
                     print(f"{YEL}Invalid choice{RESET}")
                 except ValueError:
                     print(f"{YEL}Please enter a number{RESET}")
-                except KeyboardInterrupt:
-                    raise  # Re-raise to be caught by main handler
     
     print(f"{GRN}✓ Using storage file: {storage_file}{RESET}\n")
     
@@ -263,10 +360,7 @@ def interactive_setup():
     if not username:
         default_username = defaults["username"] or ""
         prompt_text = f"{BLU}Enter your Imgur username" + (f" [{default_username}]" if default_username else "") + f": {RESET}"
-        try:
-            username = input(prompt_text).strip() or default_username
-        except KeyboardInterrupt:
-            raise  # Re-raise to be caught by main handler
+        username = input(prompt_text).strip() or default_username
         if not username:
             raise SystemExit(f"{RED}Username is required.{RESET}")
     else:
@@ -275,20 +369,14 @@ def interactive_setup():
             print(f"{GRN}✓ Detected username: {BOLD}{username}{RESET} (matches saved config)")
             if not prompt_yes_no("Use this username?", default=True):
                 default_username = defaults["username"] or username
-                try:
-                    username = input(f"{BLU}Enter your Imgur username [{default_username}]: {RESET}").strip() or default_username
-                except KeyboardInterrupt:
-                    raise  # Re-raise to be caught by main handler
+                username = input(f"{BLU}Enter your Imgur username [{default_username}]: {RESET}").strip() or default_username
         else:
             print(f"{GRN}✓ Detected username: {BOLD}{username}{RESET}")
             if defaults["username"]:
                 print(f"{BLU}  (Saved username was: {defaults['username']}){RESET}")
             if not prompt_yes_no("Use this username?", default=True):
                 default_username = defaults["username"] or username
-                try:
-                    username = input(f"{BLU}Enter your Imgur username [{default_username}]: {RESET}").strip() or default_username
-                except KeyboardInterrupt:
-                    raise  # Re-raise to be caught by main handler
+                username = input(f"{BLU}Enter your Imgur username [{default_username}]: {RESET}").strip() or default_username
         
         if not username:
             raise SystemExit(f"{RED}Username is required.{RESET}")
@@ -383,6 +471,15 @@ def validate_session(page, username):
         # If we get an error, assume session might be invalid
         return False
 
+# Page text that means Imgur dropped the session
+AUTH_FAILURE_INDICATORS = (
+    "please sign in",
+    "sign in to continue",
+    "you must be logged in",
+    "session expired",
+    "please log in",
+)
+
 def detect_auth_failure(page):
     """
     Detect if we've been logged out or redirected due to auth failure.
@@ -395,14 +492,7 @@ def detect_auth_failure(page):
         
         content = page.content().lower()
         # Check for common auth failure indicators
-        auth_indicators = [
-            "please sign in",
-            "sign in to continue",
-            "you must be logged in",
-            "session expired",
-            "please log in"
-        ]
-        for indicator in auth_indicators:
+        for indicator in AUTH_FAILURE_INDICATORS:
             if indicator in content:
                 return True
         return False
@@ -443,46 +533,105 @@ def print_banner(username, dry_run, max_to_process, headless):
 def get_posts_url(username):
     return f"https://imgur.com/user/{username}/posts"
 POST_HREF_PAT = re.compile(r"^/(gallery/|a/|post/|image/|[A-Za-z0-9]{5,})")
+# Accessible-name patterns for get_by_role, compiled once instead of per call
+ALL_TAB_PAT = re.compile(r"^\s*all\s*$", re.I)
+DELETE_POST_PAT = re.compile("Delete post", re.I)
+CANCEL_PAT = re.compile("Cancel", re.I)
+CONFIRM_ALT_PAT = re.compile("Yes, Delete It|Delete|Confirm", re.I)
 BAD_PREFIXES = (
     "/upload", "/notifications", "/settings", "/account/",
     "/user/", "/t/", "/topics", "/privacy", "/terms", "/arcade",
 )
+# Post type in one match (always succeeds; check which groups are set):
+#   album - starts with /a/ or /gallery/
+#   image - contains /image/, or (not an album) the last segment is a 7-char ID
+POST_KIND_PAT = re.compile(
+    r"^(?:(?=(?P<album>/(?:a|gallery)/)))?"
+    r"(?:.*(?P<image>/image/|(?(album)(?!)|/[^/]{7}$)))?"
+)
+# Every bad prefix is a single leading path segment, so one set lookup on that
+# segment replaces scanning the prefixes (and can't misfire on an ID like "/termsX1").
+BAD_FIRST_SEGMENTS = frozenset(p.strip("/") for p in BAD_PREFIXES)
+# Same exclusions as a CSS selector, so the browser drops nav/footer links before
+# they are returned; the Python-side checks remain as a safety net (e.g. "?query").
+POST_LINK_CSS = 'a[href^="/"]' + "".join(
+    f':not([href^="/{seg}/"]):not([href="/{seg}"])' for seg in sorted(BAD_FIRST_SEGMENTS)
+)
+
+class PostLog:
+    """
+    Collects the output lines for one post and writes them with a single flush,
+    so per-post chatter costs one terminal write and parallel workers don't interleave.
+    With buffered=False lines are printed immediately.
+    """
+    def __init__(self, buffered=True):
+        self.buffered = buffered
+        self.buf = []
+
+    def info(self, msg):
+        if self.buffered:
+            self.buf.append(msg)
+        else:
+            print(msg)
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
 
 def polite_sleep(sec: float):
     time.sleep(sec)
 
 # Default config values (used if not running interactively)
 SETTLE_DELAY = 0.3        # seconds to let SPA settle after nav
+MIN_STEP_DELAY = 0.1      # floor between UI steps so we never hammer the site
+MODAL_CSS = '[role="dialog"]'
+
+def wait_for_state(locator, state="visible", timeout=3000):
+    """
+    Wait until locator reaches state ('visible', 'hidden', ...).
+    Returns True as soon as it does, False on timeout or error.
+    """
+    try:
+        locator.wait_for(state=state, timeout=timeout)
+        return True
+    except Exception:
+        return False
 
 def safe_goto(page, url, timeout_ms=30000):
     """Navigate robustly without relying on 'networkidle' (SPAs rarely idle)."""
+    from playwright.sync_api import TimeoutError
     try:
         page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
     except TimeoutError:
         page.goto(url, timeout=timeout_ms)
     polite_sleep(SETTLE_DELAY)
 
+ALL_TAB_CSS = (
+    "a:has-text('All'), button:has-text('All'), "
+    r":text-matches('^\s*All\s*$', 'i')"
+)
+
 def select_all_tab(page):
     """Switch to the 'All' tab so Public + Hidden appear."""
     # 1) role=tab "All"
     try:
-        tab = page.get_by_role("tab", name=re.compile(r"^\s*all\s*$", re.I)).first
+        tab = page.get_by_role("tab", name=ALL_TAB_PAT).first
         if tab and tab.is_visible():
             tab.click(timeout=1500)
             polite_sleep(0.3)
             return
     except Exception:
         pass
-    # 2) text "All"
-    for sel in ["a:has-text('All')", "button:has-text('All')", "text=/^\\s*All\\s*$/i"]:
-        try:
-            el = page.locator(sel).first
-            if el and el.is_visible():
-                el.click(timeout=1500)
-                polite_sleep(0.2)
-                return
-        except Exception:
-            pass
+    # 2) text "All" (one union locator instead of probing each selector in turn)
+    try:
+        el = visible_matches(page, ALL_TAB_CSS).first
+        if el and el.is_visible():
+            el.click(timeout=1500)
+            polite_sleep(0.2)
+    except Exception:
+        pass
 
 def go_to_posts_all(page, username):
     safe_goto(page, get_posts_url(username))
@@ -493,163 +642,422 @@ def scroll_to_top(page):
     page.evaluate("() => window.scrollTo(0, 0)")
     polite_sleep(0.2)
 
-def find_post_links_sorted(page):
+SCROLL_WAIT_MS = 3000  # how long infinite scroll gets to add tiles before we call it the end
+# Count tiles and scroll in one round-trip; returns the tile count before scrolling.
+SCROLL_TO_BOTTOM_JS = """
+sel => {
+    const n = document.querySelectorAll(sel).length;
+    window.scrollTo(0, document.body.scrollHeight);
+    return n;
+}
+"""
+MORE_LINKS_JS = "([sel, n]) => document.querySelectorAll(sel).length > n"
+
+def scroll_for_more(page):
     """
-    Return [(href, x, y)] for visible grid items, sorted top-left first.
+    Scroll the grid to the bottom to trigger Imgur's infinite scroll.
+    Returns as soon as new tiles render; False if none arrive within SCROLL_WAIT_MS.
+    """
+    from playwright.sync_api import TimeoutError
+    count = page.evaluate(SCROLL_TO_BOTTOM_JS, POST_LINK_CSS)
+    try:
+        page.wait_for_function(MORE_LINKS_JS, arg=[POST_LINK_CSS, count], timeout=SCROLL_WAIT_MS)
+    except TimeoutError:
+        return False
+    return True
+
+# Imgur's grid emits tiles in visual order, so DOM order is used by default and
+# no layout is read. Set True for masonry-style layouts to sort by bounding box.
+STRICT_VISUAL_ORDER = False
+
+# Returns [[href, x, y], ...]. Without strict, anchors carry null coordinates and keep
+# DOM order; anchors with no layout boxes (display:none, detached templates) are still
+# dropped, without a reflow-heavy rect read.
+LINK_SNAPSHOT_JS = """([sel, strict]) => {
+    const out = [];
+    document.querySelectorAll(sel).forEach(a => {
+        if (!strict) {
+            if (a.getClientRects().length > 0) out.push([a.getAttribute('href'), null, null]);
+            return;
+        }
+        const r = a.getBoundingClientRect();
+        if (r.width > 0 && r.height > 0) out.push([a.getAttribute('href'), r.x, r.y]);
+    });
+    return out;
+}"""
+
+def find_post_links_sorted(page, strict_visual_order=STRICT_VISUAL_ORDER):
+    """
+    Return [(href, x, y)] for grid items, top-left first.
+    By default this is DOM order and x/y are None; with strict_visual_order
+    they are sorted by bounding box. Hidden items are skipped in both modes.
     Filters non-post links and de-dupes by href.
     """
-    sel = (
-        'a[href^="/gallery/"], a[href^="/a/"], a[href^="/post/"], '
-        'a[href^="/image/"], a[href^="/"][href*="/"]'
-    )
+    sel = POST_LINK_CSS
+    # Measure every anchor in one round-trip instead of 3-4 IPC calls per anchor.
+    # Hidden/detached tiles are skipped in-browser (no layout boxes, or a zero-sized
+    # rect in strict mode).
+    try:
+        raw = page.evaluate(LINK_SNAPSHOT_JS, [sel, strict_visual_order])
+    except Exception:
+        raw = []
     items = []
-    anchors = page.locator(sel)
-    count = anchors.count()
-    for i in range(count):
-        a = anchors.nth(i)
-        try:
-            if not a.is_visible():
-                continue
-        except Exception:
-            continue
-        href = (a.get_attribute("href") or "").split("#")[0].split("?")[0]
-        if not href.startswith("/") or href.startswith(BAD_PREFIXES):
-            continue
-        if not POST_HREF_PAT.search(href):
-            continue
-        # Bounding box for ordering (can be None if detached)
-        try:
-            box = a.bounding_box()
-        except Exception:
-            box = None
-        if not box:
+    for href, x, y in raw:
+        href = (href or "").split("#")[0].split("?")[0]
+        # POST_HREF_PAT is anchored on "/", so it also rejects relative hrefs
+        if not POST_HREF_PAT.match(href) or href.split("/", 2)[1] in BAD_FIRST_SEGMENTS:
             continue
-        items.append((href, box["x"], box["y"]))
-
-    # Sort top-left first (y then x), then de-dupe
-    items.sort(key=lambda t: (round(t[2]), round(t[1])))
-    seen, ordered = set(), []
-    for href, x, y in items:
-        if href not in seen:
-            seen.add(href)
-            ordered.append((href, x, y))
-    return ordered
-
-def safe_click(page, locator, description="element", dry_run=False, timeout=2000):
-    """
-    Conditionally click an element - only clicks if not in dry_run mode.
-    Returns True if clicked (or would click in dry-run), False otherwise.
-    """
+        items.append((href, x, y))
+
+    # Sort top-left first (y then x), then de-dupe keeping the first occurrence
+    # (dicts preserve insertion order; setdefault never overwrites)
+    if strict_visual_order:
+        items.sort(key=lambda t: (round(t[2]), round(t[1])))
+    first_by_href = {}
+    for item in items:
+        first_by_href.setdefault(item[0], item)
+    return list(first_by_href.values())
+
+def click_live(locator, description="element", timeout=2000, log=None):
+    """Click locator if visible. Returns True if clicked, False otherwise."""
     try:
         if locator.is_visible(timeout=timeout):
-            if dry_run:
-                print(f" [DRY-RUN] Would click {description}")
-                return True
-            else:
-                locator.click(timeout=timeout)
-                return True
+            locator.click(timeout=timeout)
+            return True
     except Exception:
         pass
     return False
 
-def delete_post_container(page, dry_run):
+def click_simulated(locator, description="element", timeout=2000, log=None):
+    """Dry-run counterpart of click_live: report the click instead of performing it."""
+    try:
+        if locator.is_visible(timeout=timeout):
+            (log or PostLog(buffered=False)).info(f" [DRY-RUN] Would click {description}")
+            return True
+    except Exception:
+        pass
+    return False
+
+def iter_post_links(page, seen, strict_visual_order=STRICT_VISUAL_ORDER):
+    """
+    Yield (href, x, y) grid links not yet in seen, top-left first, adding each
+    href to seen as it is handed out. The caller owns seen so it persists
+    across scroll passes and a post is never offered twice in one run.
+    """
+    for link in find_post_links_sorted(page, strict_visual_order):
+        if link[0] not in seen:
+            seen.add(link[0])
+            yield link
+
+def click_first(click, candidates, log=None, timeout=2000):
+    """
+    Try (locator, description) candidates in order with click().
+    Returns the description of the one that succeeded, or None.
+    """
+    for locator, description in candidates:
+        if click(locator, description, timeout, log):
+            return description
+    return None
+
+def visible_matches(page, selector):
+    """
+    Locator for the visible matches of selector. A union's plain .first is its earliest
+    match in the document, which may be hidden while a later alternative is visible.
+    """
+    return page.locator(f"{selector} >> visible=true")
+
+def try_click(click, page, selector, description="element", timeout=2000, log=None):
+    """
+    Click the first visible match of selector with click(), skipping it when nothing matches.
+    count() answers immediately, so a missing selector never costs a click timeout.
+    """
+    locator = visible_matches(page, selector)
+    try:
+        if locator.count() == 0:
+            return False
+    except Exception:
+        return False
+    return click(locator.first, description, timeout, log)
+
+PHASE_BUDGET = 3.0  # seconds one selector-tier phase may spend before giving up
+
+def click_tiers(click, page, selectors, description, timeout=2000, log=None, budget=PHASE_BUDGET):
+    """
+    try_click() each selector tier in order within an overall budget (seconds), shrinking
+    the last click's timeout so the phase never overshoots it (never to 0, which
+    Playwright treats as "no timeout").
+    Returns the selector that was clicked, or None.
+    """
+    deadline = time.monotonic() + budget
+    for selector in selectors:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if try_click(click, page, selector, f"{description} ({selector})",
+                     timeout=max(1, min(timeout, int(remaining * 1000))), log=log):
+            return selector
+    return None
+
+# One raw CDP session per page for the hot confirm click (Chromium only)
+CDP_SESSIONS = weakref.WeakKeyDictionary()
+
+# Clicks the first visible button whose text equals the label, dialog buttons first.
+CDP_CLICK_BUTTON_JS = """(() => {
+    const want = %s;
+    const buttons = [...document.querySelectorAll('[role="dialog"] button'),
+                     ...document.querySelectorAll('button')];
+    for (const b of buttons) {
+        if (b.offsetParent !== null && b.textContent.trim().toLowerCase() === want) {
+            b.click();
+            return true;
+        }
+    }
+    return false;
+})()"""
+
+def cdp_click_button(page, label):
+    """
+    Click a button by its exact text through a raw CDP Runtime.evaluate, skipping
+    Playwright's auto-wait/actionability round-trips.
+    Returns False if no button matched or CDP is unavailable, so callers can fall back.
+    """
+    try:
+        cdp = CDP_SESSIONS.get(page)
+        if cdp is None:
+            cdp = page.context.new_cdp_session(page)
+            CDP_SESSIONS[page] = cdp
+        res = cdp.send("Runtime.evaluate", {
+            "expression": CDP_CLICK_BUTTON_JS % json.dumps(label.lower()),
+            "returnByValue": True,
+        })
+        return bool(res.get("result", {}).get("value"))
+    except Exception:
+        return False
+
+DELETE_POST_CSS = (
+    'button:has-text("Delete post"), '
+    '[role="button"]:has-text("Delete post"), '
+    'button[aria-label*="Delete post" i], '
+    'a:has-text("Delete post"), '
+    ':text-is("Delete post")'  # non-button menu items / spans
+)
+
+def delete_post_container(page, dry_run, log=None):
     """
     Delete a post/album container by clicking "Delete post" button.
     Returns True if deletion was initiated, False otherwise.
     """
+    log = log or PostLog(buffered=False)
     polite_sleep(0.2)  # Wait for page to settle
     
-    delete_post_clicked = False
+    click = click_simulated if dry_run else click_live
+    prefix = " [DRY-RUN]" if dry_run else ""
     
-    # Try multiple selectors for the delete post button
-    delete_post_selectors = [
-        'button:has-text("Delete post")',
-        'text="Delete post"',
-        '[role="button"]:has-text("Delete post")',
-        'button[aria-label*="Delete post" i]',
-        'a:has-text("Delete post")',
-        '*:has-text("Delete post"):visible',
-    ]
-    
-    for selector in delete_post_selectors:
-        try:
-            delete_post_btn = page.locator(selector).first
-            if safe_click(page, delete_post_btn, f"'Delete post' button ({selector})", dry_run):
-                if dry_run:
-                    print(f" [DRY-RUN] {GRN}✓ Found and clicked 'Delete post' button{RESET}")
-                else:
-                    print(f" {GRN}✓ Found and clicked 'Delete post' button{RESET}")
-                polite_sleep(0.2)
-                delete_post_clicked = True
-                break
-        except Exception:
-            continue
-    
-    # Also try role-based
-    if not delete_post_clicked:
-        try:
-            delete_post_btn = page.get_by_role("button", name=re.compile("Delete post", re.I)).first
-            if safe_click(page, delete_post_btn, "'Delete post' button (role-based)", dry_run):
-                if dry_run:
-                    print(f" [DRY-RUN] {GRN}✓ Found and clicked 'Delete post' button (role-based){RESET}")
-                else:
-                    print(f" {GRN}✓ Found and clicked 'Delete post' button (role-based){RESET}")
-                polite_sleep(0.2)
-                delete_post_clicked = True
-        except Exception:
-            pass
+    # All "Delete post" variants resolve in a single union query; role-based as fallback
+    clicked = click_first(click, [
+        (visible_matches(page, DELETE_POST_CSS).first, "'Delete post' button"),
+        (page.get_by_role("button", name=DELETE_POST_PAT).first,
+         "'Delete post' button (role-based)"),
+    ], log=log)
+    delete_post_clicked = clicked is not None
     
     if delete_post_clicked:
-        # Wait for modal to appear
-        polite_sleep(0.4)
+        log.info(f"{prefix} {GRN}✓ Found and clicked {clicked}{RESET}")
+        # Wait for modal to appear (dry-run never opens it, so don't wait there)
+        if not dry_run:
+            wait_for_state(visible_matches(page, MODAL_CSS).first, "visible", timeout=3000)
+        polite_sleep(MIN_STEP_DELAY)
         
-        # Look for confirmation button in modal
-        confirmation_clicked = False
-        confirmation_selectors = [
-            ('role', 'button', 'Delete Post Only'),
-            ('role', 'button', 'Delete Post'),
-            ('selector', 'button:has-text("Delete Post Only")'),
-            ('selector', 'button:has-text("Delete Post")'),
+        # Look for confirmation button in modal ("Delete Post Only" must win)
+        confirmations = [
+            (page.get_by_role('button', name='Delete Post Only').first, "'Delete Post Only' button in modal"),
+            (page.get_by_role('button', name='Delete Post').first, "'Delete Post' button in modal"),
+            (page.locator('button:has-text("Delete Post Only")').first, "'Delete Post Only' button in modal (text)"),
+            (page.locator('button:has-text("Delete Post")').first, "'Delete Post' button in modal (text)"),
         ]
-        
-        for selector_type, *args in confirmation_selectors:
-            try:
-                if selector_type == 'role':
-                    btn = page.get_by_role('button', name=args[0]).first
-                else:  # selector
-                    btn = page.locator(args[0]).first
-                
-                if safe_click(page, btn, f"'{args[0]}' button in modal", dry_run):
-                    confirmation_clicked = True
-                    if dry_run:
-                        print(f" [DRY-RUN] {GRN}✓ Deleted post/album{RESET}")
-                    else:
-                        print(f" {GRN}✓ Deleted post/album{RESET}")
-                    polite_sleep(0.2)
-                    break
-            except Exception:
-                continue
+        confirmed = click_first(click, confirmations, log=log)
+        confirmation_clicked = confirmed is not None
+        if confirmation_clicked:
+            log.info(f"{prefix} {GRN}✓ Deleted post/album{RESET}")
+            if not dry_run:
+                # The clicked button goes away once the request is accepted; any other
+                # (possibly already hidden) dialog on the page says nothing about that
+                confirm_btn = next(loc for loc, desc in confirmations if desc == confirmed)
+                wait_for_state(confirm_btn, "hidden", timeout=3000)
+            polite_sleep(MIN_STEP_DELAY)
         
         return confirmation_clicked or delete_post_clicked  # Return True if any action succeeded
     
     return False
 
-def delete_one(page, href, dry_run, username=None):
+# Selector tiers for delete_one. Each entry is one comma-separated union that the
+# browser resolves in a single query; tiers are still tried in order because a union's
+# .first is the earliest match in the document, not the most specific alternative.
+THREE_DOTS_SELECTORS = (
+    # Labelled menu buttons
+    'button[aria-label*="more" i], button[aria-label*="options" i], [aria-label*="more options" i]',
+    # Icon-only buttons, identified by the icon's class
+    'button:has([class*="more"]), button:has([class*="menu"]), '
+    'button:has([class*="dots"]), [role="button"]:has([class*="more"])',
+    # Text glyph fallback
+    'button:has-text("⋯"), button:has-text("...")',
+)
+# Role-only markup is matched with plain attribute selectors rather than get_by_role,
+# which computes the accessible name of every element on the page.
+DELETE_IMAGE_SELECTORS = (
+    ':text-is("Delete image"), button:has-text("Delete image"), '
+    '[role="menuitem"]:has-text("Delete image"), a:has-text("Delete image"), '
+    '[role="menuitem"][aria-label*="Delete image" i]',
+)
+DELETE_FROM_ACCOUNT_SELECTORS = (
+    'button.DeleteImageDialog-confirm--accountRemove, '  # Specific class from Imgur
+    'button:has-text("Delete from account"), :text-is("Delete from account"), '
+    'button[aria-label*="Delete from account" i], [role="button"][aria-label*="Delete from account" i], '
+    '[role="button"]:has-text("Delete from account")',
+    # Styling-based guesses only if nothing is labelled
+    '[role="dialog"] button:has([class*="red"]), [role="dialog"] button:has([class*="danger"])',
+)
+# The confirmation step's own button, waited on before mark_confirm_button() looks it up
+CONFIRM_BUTTON_CSS = 'button:has-text("Yes, Delete It")'
+# Dry-run modal dismissal; tried one at a time, in order
+CANCEL_SELECTORS = (
+    'button:has-text("Cancel")',
+    'text="Cancel"',
+    '[role="button"]:has-text("Cancel")',
+    'button[aria-label*="Cancel" i]',
+    'button:has-text("Close")',
+    '[role="dialog"] button:has-text("Cancel")',
+)
+
+MENU_BUTTON_MARK = "data-autodelete-menu"
+MARK_MENU_BUTTON_JS = """() => {
+    document.querySelectorAll('[%s]').forEach(b => b.removeAttribute('%s'));
+    for (const b of document.querySelectorAll('button')) {
+        const a = (b.getAttribute('aria-label') || '').toLowerCase();
+        if (b.offsetParent !== null &&
+                (a.includes('more') || a.includes('menu') || a.includes('options'))) {
+            b.setAttribute('%s', '');
+            return true;
+        }
+    }
+    return false;
+}""" % ((MENU_BUTTON_MARK,) * 3)
+
+# Confirmation button alternatives: (css, any-of words in the text, case-insensitive),
+# checked in order; None matches regardless of text. Modal-scoped entries come before
+# page-wide ones so a "Delete ..." button elsewhere on the page can't win.
+CONFIRM_BUTTON_CANDIDATES = (
+    ('button', ('yes, delete it',)),
+    ('[role="dialog"] button', ('delete', 'confirm')),
+    ('button[data-action="confirm"]', None),
+    ('[role="button"]', ('yes, delete it',)),
+    ('[role="dialog"] [role="button"]', ('delete', 'confirm')),
+    ('button', ('delete', 'confirm')),
+)
+CONFIRM_BUTTON_MARK = "data-autodelete-confirm"
+MARK_CONFIRM_BUTTON_JS = """([mark, candidates]) => {
+    document.querySelectorAll(`[${mark}]`).forEach(b => b.removeAttribute(mark));
+    for (let i = 0; i < candidates.length; i++) {
+        const [css, words] = candidates[i];
+        for (const b of document.querySelectorAll(css)) {
+            const t = (b.textContent || '').toLowerCase();
+            if (b.offsetParent !== null && (!words || words.some(w => t.includes(w)))) {
+                b.setAttribute(mark, '');
+                return i;
+            }
+        }
+    }
+    return -1;
+}"""
+
+def mark_confirm_button(page):
+    """
+    Find the confirmation button in one round-trip and tag it with CONFIRM_BUTTON_MARK.
+    Returns a description of the candidate that matched, or None.
+    """
+    try:
+        index = page.evaluate(MARK_CONFIRM_BUTTON_JS, [CONFIRM_BUTTON_MARK, CONFIRM_BUTTON_CANDIDATES])
+    except Exception:
+        return None
+    if index < 0:
+        return None
+    css, words = CONFIRM_BUTTON_CANDIDATES[index]
+    return f"{css} {'/'.join(words)}" if words else css
+
+def start_navigation(page, url):
+    """
+    Begin loading url in page without waiting for it, so the browser fetches and
+    renders it while the script keeps working on another page.
+    """
+    try:
+        page.evaluate("url => { window.location.href = url; }", url)
+    except Exception:
+        pass  # Navigation may tear down the execution context mid-call
+
+# Title + main heading is all Imgur's 404 page needs to be recognised, and is a few
+# bytes over CDP instead of the whole serialized DOM that page.content() returns.
+PAGE_SUMMARY_JS = "() => document.title + ' ' + (document.querySelector('h1')?.innerText || '')"
+
+def page_summary(page):
+    """Return the page's lowercased title and first <h1> text."""
+    return page.evaluate(PAGE_SUMMARY_JS).lower()
+
+def post_deleted(page, url):
+    """
+    Load url in page and check whether Imgur shows it as deleted.
+    Returns True (404 or not-found page), False (post still loads), or None if unclear.
+    """
+    from playwright.sync_api import TimeoutError
+    try:
+        # Headers are enough when Imgur answers with a real 404
+        resp = page.goto(url, wait_until="commit", timeout=5000)
+        if resp is not None and resp.status == 404:
+            return True
+        # Soft 404: the SPA may answer 200 and render the error page itself
+        page.wait_for_load_state("domcontentloaded", timeout=5000)
+        polite_sleep(0.3)
+        summary = page_summary(page)
+        if "404" in summary or "not found" in summary or "page doesn't exist" in summary:
+            return True
+        # Still on the post page, so the deletion didn't take
+        if url in page.url:
+            return False
+    except TimeoutError:
+        return True  # Timeout might mean 404/redirect
+    except Exception:
+        pass  # Other errors - can't tell
+    return None
+
+def delete_one(page, href, dry_run, username=None, preloaded=False, log=None):
     """
     Delete an image or post from Imgur.
+    Pass preloaded=True when start_navigation() already pointed page at href.
+    Callers verify deletions themselves (verify_deleted() / post_deleted()).
+    Output goes to log (a PostLog the caller flushes); printed directly if omitted.
     Returns: (success: bool, images_deleted: int)
     For single images: returns (True, 1) or (False, 0)
     For albums: returns (True, 0) when post is ungrouped (no images deleted), or (False, 0) on failure
     """
+    from playwright.sync_api import TimeoutError
+    log = log or PostLog(buffered=False)
+    click = click_simulated if dry_run else click_live
     url = "https://imgur.com" + href
-    safe_goto(page, url, timeout_ms=20000)
+    if preloaded and href in page.url:
+        try:
+            page.wait_for_load_state("domcontentloaded", timeout=20000)
+            polite_sleep(SETTLE_DELAY)
+        except TimeoutError:
+            safe_goto(page, url, timeout_ms=20000)
+    else:
+        safe_goto(page, url, timeout_ms=20000)
     polite_sleep(0.3)  # Give page time to fully load
 
     # Determine if this is an image (single) or post/album
     # Albums: /a/xxxxx or /gallery/xxxxx
     # Direct images: /xxxxxxx (7 char ID, no /a/ prefix) or /image/xxxxx
-    is_album = href.startswith("/a/") or href.startswith("/gallery/")
-    is_image = "/image/" in href or (href.startswith("/") and len(href.split("/")[-1]) == 7 and not is_album)
+    kind = POST_KIND_PAT.match(href)
+    is_album = kind.group("album") is not None
+    is_image = kind.group("image") is not None
     
     deleted = False
     
@@ -657,9 +1065,9 @@ def delete_one(page, href, dry_run, username=None):
         # For image pages: "Delete image" is directly available
         # Flow (from codegen): Click "Delete image" → Click "Yes, Delete It" → Navigate back to /posts
         if dry_run:
-            print(f" [DRY-RUN] Image page detected: {url}")
+            log.info(f" [DRY-RUN] Image page detected: {url}")
         else:
-            print(f" {BLU}Individual image page - using 'Delete image' button{RESET}")
+            log.info(f" {BLU}Individual image page - using 'Delete image' button{RESET}")
         
         # Step 1: Click the "Delete image" button (role-based, as per codegen)
         try:
@@ -670,55 +1078,46 @@ def delete_one(page, href, dry_run, username=None):
                 polite_sleep(0.5)
                 if not delete_btn.is_visible(timeout=2000):
                     if dry_run:
-                        print(f" [DRY-RUN] {YEL}⚠ 'Delete image' button not visible{RESET}")
+                        log.info(f" [DRY-RUN] {YEL}⚠ 'Delete image' button not visible{RESET}")
                     else:
-                        print(f" {YEL}⚠ 'Delete image' button not visible{RESET}")
+                        log.info(f" {YEL}⚠ 'Delete image' button not visible{RESET}")
                     return False, 0
             
             if dry_run:
                 # In dry-run, actually click to open modal
                 try:
                     delete_btn.click(timeout=3000)
-                    print(f" [DRY-RUN] {GRN}✓ Clicked 'Delete image' button (opened modal){RESET}")
-                    polite_sleep(0.2)  # Brief wait for modal to appear
+                    log.info(f" [DRY-RUN] {GRN}✓ Clicked 'Delete image' button (opened modal){RESET}")
+                    wait_for_state(visible_matches(page, MODAL_CSS).first, "visible", timeout=3000)
                 except Exception as e:
-                    print(f" [DRY-RUN] {YEL}⚠ Could not click 'Delete image' button: {e}{RESET}")
+                    log.info(f" [DRY-RUN] {YEL}⚠ Could not click 'Delete image' button: {e}{RESET}")
                     return False, 0
             else:
-                if safe_click(page, delete_btn, "'Delete image' button", dry_run):
-                    print(f" {GRN}✓ Clicked 'Delete image' button{RESET}")
-                    polite_sleep(0.2)  # Brief wait for modal to appear
+                if click(delete_btn, "'Delete image' button", log=log):
+                    log.info(f" {GRN}✓ Clicked 'Delete image' button{RESET}")
+                    wait_for_state(visible_matches(page, MODAL_CSS).first, "visible", timeout=3000)
                 else:
-                    print(f" {YEL}⚠ Could not click 'Delete image' button{RESET}")
+                    log.info(f" {YEL}⚠ Could not click 'Delete image' button{RESET}")
                     return False, 0
         except Exception as e:
             if dry_run:
-                print(f" [DRY-RUN] {YEL}⚠ Could not find 'Delete image' button: {e}{RESET}")
+                log.info(f" [DRY-RUN] {YEL}⚠ Could not find 'Delete image' button: {e}{RESET}")
             else:
-                print(f" {YEL}⚠ Could not find 'Delete image' button: {e}{RESET}")
+                log.info(f" {YEL}⚠ Could not find 'Delete image' button: {e}{RESET}")
             return False, 0
         
         # Step 2: In dry-run, click Cancel; otherwise click "Yes, Delete It"
         if dry_run:
             # In dry-run mode, click Cancel to close the modal without deleting
-            polite_sleep(0.3)  # Wait for modal to appear
+            polite_sleep(MIN_STEP_DELAY)
             cancel_clicked = False
-            cancel_selectors = [
-                'button:has-text("Cancel")',
-                'text="Cancel"',
-                '[role="button"]:has-text("Cancel")',
-                'button[aria-label*="Cancel" i]',
-                'button:has-text("Close")',
-                '[role="dialog"] button:has-text("Cancel")',
-            ]
-            
-            for selector in cancel_selectors:
+            for selector in CANCEL_SELECTORS:
                 try:
                     cancel_btn = page.locator(selector).first
                     if cancel_btn.is_visible(timeout=2000):
                         # In dry-run, actually click Cancel to close modal
                         cancel_btn.click(timeout=2000)
-                        print(f" [DRY-RUN] {GRN}✓ Clicked 'Cancel' - modal closed (simulated deletion){RESET}")
+                        log.info(f" [DRY-RUN] {GRN}✓ Clicked 'Cancel' - modal closed (simulated deletion){RESET}")
                         polite_sleep(0.1)
                         cancel_clicked = True
                         break
@@ -728,18 +1127,18 @@ def delete_one(page, href, dry_run, username=None):
             # Also try role-based
             if not cancel_clicked:
                 try:
-                    cancel_btn = page.get_by_role("button", name=re.compile("Cancel", re.I)).first
+                    cancel_btn = page.get_by_role("button", name=CANCEL_PAT).first
                     if cancel_btn.is_visible(timeout=2000):
                         # In dry-run, actually click Cancel to close modal
                         cancel_btn.click(timeout=2000)
-                        print(f" [DRY-RUN] {GRN}✓ Clicked 'Cancel' - modal closed (simulated deletion){RESET}")
+                        log.info(f" [DRY-RUN] {GRN}✓ Clicked 'Cancel' - modal closed (simulated deletion){RESET}")
                         polite_sleep(0.1)
                         cancel_clicked = True
                 except Exception:
                     pass
             
             if not cancel_clicked:
-                print(f" [DRY-RUN] {YEL}⚠ Could not find 'Cancel' button - modal may close on its own{RESET}")
+                log.info(f" [DRY-RUN] {YEL}⚠ Could not find 'Cancel' button - modal may close on its own{RESET}")
                 polite_sleep(0.2)
             
             # Return success since we simulated the deletion flow
@@ -749,17 +1148,20 @@ def delete_one(page, href, dry_run, username=None):
             try:
                 confirm_btn = page.get_by_role("button", name="Yes, Delete It").first
                 if not confirm_btn.is_visible(timeout=3000):
-                    print(f" {YEL}⚠ 'Yes, Delete It' button not visible{RESET}")
+                    log.info(f" {YEL}⚠ 'Yes, Delete It' button not visible{RESET}")
                     return False, 0
                 
-                if safe_click(page, confirm_btn, "'Yes, Delete It' button", dry_run):
-                    print(f" {GRN}✓ Clicked 'Yes, Delete It' - deleting image{RESET}")
-                    polite_sleep(0.2)  # Brief wait for click to register
+                if (cdp_click_button(page, "Yes, Delete It")
+                        or click(confirm_btn, "'Yes, Delete It' button", log=log)):
+                    log.info(f" {GRN}✓ Clicked 'Yes, Delete It' - deleting image{RESET}")
+                    # The button's modal closes once the delete request is accepted
+                    wait_for_state(confirm_btn, "hidden", timeout=3000)
+                    polite_sleep(MIN_STEP_DELAY)
                 else:
-                    print(f" {YEL}⚠ Could not click 'Yes, Delete It' button{RESET}")
+                    log.info(f" {YEL}⚠ Could not click 'Yes, Delete It' button{RESET}")
                     return False, 0
             except Exception as e:
-                print(f" {YEL}⚠ Could not find 'Yes, Delete It' button: {e}{RESET}")
+                log.info(f" {YEL}⚠ Could not find 'Yes, Delete It' button: {e}{RESET}")
                 return False, 0
         
         # Deletion initiated - main loop will navigate back to /posts
@@ -770,194 +1172,106 @@ def delete_one(page, href, dry_run, username=None):
         # This only deletes the post grouping - it does NOT delete individual images
         polite_sleep(0.4)  # Let album page fully load
         
-        print(f" {BLU}Analyzing album page: {page.url}{RESET}")
+        log.info(f" {BLU}Analyzing album page: {page.url}{RESET}")
         
         # Count images in album for reporting purposes
         image_count = None
         try:
-            three_dots_all = page.locator('text="..."').all()
-            detected_image_count = len(three_dots_all)
+            detected_image_count = page.locator('text="..."').count()
             if detected_image_count > 0:
-                print(f" {BLU}Album contains {detected_image_count} image(s) - deleting post container...{RESET}")
+                log.info(f" {BLU}Album contains {detected_image_count} image(s) - deleting post container...{RESET}")
                 image_count = detected_image_count
         except Exception:
             pass
         
         # Delete the post container - this ungroups the album
         # The images themselves are not deleted, only the post/album grouping
-        print(f" {BLU}Deleting post container to ungroup album...{RESET}")
-        deleted = delete_post_container(page, dry_run)
+        log.info(f" {BLU}Deleting post container to ungroup album...{RESET}")
+        deleted = delete_post_container(page, dry_run, log=log)
         
         if deleted:
             # IMPORTANT: We return True, 0 because:
             # - True: Post container deletion (ungrouping) succeeded
             # - 0: No images were deleted (only the post grouping was removed)
             if dry_run:
-                print(f" [DRY-RUN] {BLU}✓ Album post deleted (ungrouped){RESET}")
+                log.info(f" [DRY-RUN] {BLU}✓ Album post deleted (ungrouped){RESET}")
             else:
-                print(f" {BLU}✓ Album post deleted (ungrouped){RESET}")
+                log.info(f" {BLU}✓ Album post deleted (ungrouped){RESET}")
             return True, 0
         else:
-            print(f" {YEL}⚠ Could not ungroup album/post container{RESET}")
+            log.info(f" {YEL}⚠ Could not ungroup album/post container{RESET}")
             return False, 0
     else:
         # For other post types: Try three dots → Delete image
         # Strategy 1: Find three dots menu button
-        three_dots_selectors = [
-            'button[aria-label*="more" i]',
-            'button[aria-label*="More" i]',
-            'button[aria-label*="options" i]',
-            '[aria-label*="more options" i]',
-            'button:has([class*="more"])',
-            'button:has([class*="menu"])',
-            'button:has([class*="dots"])',
-            '[role="button"]:has([class*="more"])',
-            'button:has-text("⋯")',
-            'button:has-text("...")',
-        ]
-        
-        three_dots_clicked = False
-        for selector in three_dots_selectors:
-            try:
-                btn = page.locator(selector).first
-                if safe_click(page, btn, f"three dots menu ({selector})", dry_run, timeout=1500):
-                    polite_sleep(0.3)
-                    three_dots_clicked = True
-                    break
-            except Exception:
-                continue
+        three_dots_clicked = click_tiers(
+            click, page, THREE_DOTS_SELECTORS, "three dots menu", timeout=1500, log=log
+        ) is not None
         
         if not three_dots_clicked:
+            # Scan aria-labels in-page (one round-trip instead of one per button) and
+            # tag the match so it can be clicked through the normal locator path
             try:
-                buttons = page.locator('button').all()
-                for btn in buttons:
-                    try:
-                        aria_label = btn.get_attribute("aria-label") or ""
-                        if "more" in aria_label.lower() or "menu" in aria_label.lower() or "options" in aria_label.lower():
-                            if safe_click(page, btn, "three dots menu (button scan)", dry_run, timeout=500):
-                                polite_sleep(0.3)
-                                three_dots_clicked = True
-                                break
-                    except Exception:
-                        continue
+                if page.evaluate(MARK_MENU_BUTTON_JS):
+                    btn = page.locator(f"[{MENU_BUTTON_MARK}]").first
+                    if click(btn, "three dots menu (button scan)", timeout=500, log=log):
+                        three_dots_clicked = True
             except Exception:
                 pass
         
         if three_dots_clicked:
-            # Find "Delete image" in context menu
-            delete_image_selectors = [
-                'text="Delete image"',
-                'button:has-text("Delete image")',
-                '[role="menuitem"]:has-text("Delete image")',
-                '[role="menu"] button:has-text("Delete image")',
-                'a:has-text("Delete image")',
-                '*:has-text("Delete image"):visible',
-            ]
-            
-            clicked_delete_image = False
-            for selector in delete_image_selectors:
-                try:
-                    delete_btn = page.locator(selector).first
-                    if safe_click(page, delete_btn, f"'Delete image' button ({selector})", dry_run, timeout=1500):
-                        polite_sleep(0.3)  # Wait for modal
-                        clicked_delete_image = True
-                        break
-                except Exception:
-                    continue
-            
-            if not clicked_delete_image:
-                try:
-                    delete_btn = page.get_by_role("menuitem", name=re.compile("Delete image", re.I)).first
-                    if safe_click(page, delete_btn, "'Delete image' button (menuitem role)", dry_run, timeout=1500):
-                        polite_sleep(0.3)
-                        clicked_delete_image = True
-                except Exception:
-                    pass
-            
-            if not clicked_delete_image:
-                print(f" {YEL}⚠ Could not find 'Delete image' option in menu{RESET}")
+            # Find "Delete image" in context menu; returns as soon as the menu renders
+            # (only a live click actually opens it)
+            if not dry_run:
+                wait_for_state(visible_matches(page, DELETE_IMAGE_SELECTORS[0]).first, "visible", timeout=1500)
+            if not click_tiers(click, page, DELETE_IMAGE_SELECTORS, "'Delete image' button",
+                               timeout=1500, log=log):
+                log.info(f" {YEL}⚠ Could not find 'Delete image' option in menu{RESET}")
                 return False, 0
             
             # Modal should now be open - click "Delete from account" (not "Remove from post")
-            delete_from_account_selectors = [
-                'button.DeleteImageDialog-confirm--accountRemove',  # Specific class from Imgur
-                'button:has-text("Delete from account")',
-                'text="Delete from account"',
-                '[role="dialog"] button:has-text("Delete from account")',
-                'button[aria-label*="Delete from account" i]',
-                '[role="dialog"] button:has([class*="red"])',
-                '[role="dialog"] button:has([class*="danger"])',
-            ]
-            
-            for selector in delete_from_account_selectors:
-                try:
-                    delete_account_btn = page.locator(selector).first
-                    if safe_click(page, delete_account_btn, f"'Delete from account' button ({selector})", dry_run):
-                        if dry_run:
-                            print(f" [DRY-RUN] {GRN}✓ Clicking 'Delete from account'{RESET}")
-                        else:
-                            print(f" {GRN}✓ Clicking 'Delete from account'{RESET}")
-                        polite_sleep(0.3)
-                        deleted = True
-                        break
-                except Exception:
-                    continue
+            if not dry_run:
+                wait_for_state(visible_matches(page, DELETE_FROM_ACCOUNT_SELECTORS[0]).first, "visible", timeout=1500)
+            if click_tiers(click, page, DELETE_FROM_ACCOUNT_SELECTORS, "'Delete from account' button", log=log):
+                if dry_run:
+                    log.info(f" [DRY-RUN] {GRN}✓ Clicking 'Delete from account'{RESET}")
+                else:
+                    log.info(f" {GRN}✓ Clicking 'Delete from account'{RESET}")
+                deleted = True
             
             if not deleted:
-                try:
-                    delete_account_btn = page.get_by_role("button", name=re.compile("Delete from account", re.I)).first
-                    if safe_click(page, delete_account_btn, "'Delete from account' button (role regex)", dry_run):
-                        if dry_run:
-                            print(f" [DRY-RUN] {GRN}✓ Clicking 'Delete from account' via role{RESET}")
-                        else:
-                            print(f" {GRN}✓ Clicking 'Delete from account' via role{RESET}")
-                        polite_sleep(0.3)
-                        deleted = True
-                except Exception:
-                    print(f" {YEL}⚠ Could not find 'Delete from account' button in modal{RESET}")
+                log.info(f" {YEL}⚠ Could not find 'Delete from account' button in modal{RESET}")
         else:
-            print(f" {YEL}⚠ Could not find three dots menu for {url}{RESET}")
+            log.info(f" {YEL}⚠ Could not find three dots menu for {url}{RESET}")
             return False, 0
     
     if not deleted:
-        print(f" {YEL}⚠ Could not find delete option for {url}{RESET}")
+        log.info(f" {YEL}⚠ Could not find delete option for {url}{RESET}")
         return False, 0
     
-    # Wait for confirmation dialog/modal to appear
-    polite_sleep(0.3)
+    # Wait for the confirmation button itself. A union of all the alternatives would
+    # match the "Delete from account" dialog just clicked and return before it closes.
+    if not dry_run:
+        wait_for_state(visible_matches(page, CONFIRM_BUTTON_CSS).first, "visible", timeout=1500)
+    polite_sleep(MIN_STEP_DELAY)
     
     # Strategy 2: Confirm deletion
-    confirm_selectors = [
-        'button:has-text("Yes, Delete It")',
-        'button:has-text("Delete")',
-        'button:has-text("Confirm")',
-        'button[data-action="confirm"]',
-        '[role="dialog"] button:has-text("Delete")',
-        '[role="dialog"] button:has-text("Confirm")',
-    ]
-    
     confirmed = False
-    for selector in confirm_selectors:
-        try:
-            cbtn = page.locator(selector).first
-            if safe_click(page, cbtn, f"confirmation button ({selector})", dry_run):
-                polite_sleep(0.3)  # Wait for deletion to process
-                confirmed = True
-                break
-        except Exception:
-            continue
-    
-    # Also try role-based confirmation
+    if not dry_run and cdp_click_button(page, "Yes, Delete It"):
+        polite_sleep(0.3)  # Wait for deletion to process
+        confirmed = True
+    confirm_desc = None if confirmed else mark_confirm_button(page)
+    if confirm_desc and click(page.locator(f"[{CONFIRM_BUTTON_MARK}]").first,
+                              f"confirmation button ({confirm_desc})", log=log):
+        polite_sleep(0.3)  # Wait for deletion to process
+        confirmed = True
     if not confirmed:
-        for label in ["Yes, Delete It", "Delete", "Confirm"]:
-            try:
-                cbtn = page.get_by_role("button", name=re.compile(label, re.I)).first
-                if safe_click(page, cbtn, f"confirmation button (role: {label})", dry_run):
-                    polite_sleep(1.0)
-                    confirmed = True
-                    break
-            except Exception:
-                continue
+        # Accessible-name fallback for icon/aria-label-only buttons the text scan can't see;
+        # one alternation means one accessibility-tree pass instead of one per label
+        cbtn = page.get_by_role("button", name=CONFIRM_ALT_PAT).first
+        if click(cbtn, "confirmation button (role alt)", log=log):
+            polite_sleep(0.3)  # Wait for deletion to process
+            confirmed = True
     
     if not confirmed:
         # Maybe it deleted on first click, or confirmation wasn't needed
@@ -967,8 +1281,8 @@ def delete_one(page, href, dry_run, username=None):
         
         # Check for error/success indicators in page content
         try:
-            page_content = page.content().lower()
-            if "404" in page_content or "not found" in page_content or "deleted" in page_content:
+            summary = page_summary(page)
+            if "404" in summary or "not found" in summary or "deleted" in summary:
                 return True, 1  # Probably deleted (count as 1)
         except Exception:
             pass
@@ -978,42 +1292,200 @@ def delete_one(page, href, dry_run, username=None):
             # Check if we're redirected to a valid page (not 404)
             try:
                 page.wait_for_load_state("domcontentloaded", timeout=3000)
-                if "404" not in page.content().lower():
+                if "404" not in page_summary(page):
                     return True, 1  # Redirected to valid page, probably deleted (count as 1)
             except Exception:
                 pass
     
-    # Final verification: try to navigate back to the URL and see if it still exists
-    if confirmed or deleted:
-        polite_sleep(0.4)  # Give deletion time to process
-        try:
-            page.goto(url, wait_until="domcontentloaded", timeout=5000)
-            polite_sleep(0.3)
-            content_lower = page.content().lower()
-            # If we see 404 or "not found", it's deleted
-            if "404" in content_lower or "not found" in content_lower or "page doesn't exist" in content_lower:
-                return True, 1  # Deleted (count as 1)
-            # If we're still on the post page, deletion might have failed
-            if url in page.url:
-                print(f" {YEL}⚠ Deletion may have failed - post still accessible at {url}{RESET}")
-                return False, 0
-        except TimeoutError:
-            # Timeout might mean 404/redirect
-            return True, 1  # Probably deleted (count as 1)
-        except Exception:
-            # Other errors - assume it might have worked
-            pass
-    
     # Return success status and count
     if confirmed or deleted:
         return True, 1  # Single image/post deletion = 1 item
     else:
         return False, 0
 
-def main():
+VERIFY_EVERY_N = 20  # Parallel passes re-check only every Nth post with post_deleted()
+VERIFY_BATCH_SIZE = 10  # Deleted posts to collect before one batched status check
+# One IPC for the whole batch; the HEAD requests run in parallel inside the page.
+# Network errors map to status 0 ("unknown") rather than failing the batch.
+VERIFY_STATUS_JS = """
+urls => Promise.all(urls.map(u =>
+    fetch(u, {method: 'HEAD', credentials: 'include', redirect: 'manual'})
+        .then(r => r.status, () => 0)))
+"""
+
+def verify_deleted(page, hrefs, check_page=None):
+    """
+    HEAD-request recently deleted hrefs from inside page (which must be on imgur.com).
+    404 means deleted. A 200 may be the SPA's soft 404, so those posts are loaded in
+    check_page and judged by post_deleted(); without check_page they stay unknown.
+    Warns about and returns the hrefs that are confirmed to still exist.
+    """
+    if not hrefs:
+        return []
+    try:
+        statuses = page.evaluate(VERIFY_STATUS_JS, ["https://imgur.com" + href for href in hrefs])
+    except Exception:
+        return []  # Can't tell; don't report false failures
+    survivors = [
+        href for href, status in zip(hrefs, statuses)
+        if status == 200 and check_page is not None
+        and post_deleted(check_page, "https://imgur.com" + href) is False
+    ]
+    for href in survivors:
+        print(f" {YEL}⚠ Deletion may have failed - post still accessible at https://imgur.com{href}{RESET}")
+    return survivors
+
+def record_result(ok, images_count, processed, dry_run):
+    """Print the outcome of one delete_one() call and return the updated processed count."""
+    if ok:
+        # Albums (images_count == 0) count as 1 item processed
+        if images_count == 0:
+            processed += 1
+            print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} post (total: {processed})")
+        else:
+            processed += images_count  # Add actual number of images deleted
+            if images_count == 1:
+                print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} image (total: {processed})")
+            else:
+                print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} {images_count} image(s) (total: {processed})")
+    else:
+        processed += 1  # Count attempt even if failed
+        print(f" -> {YEL}Failed{RESET} (total attempts: {processed})")
+    return processed
+
+WORKER_START_GAP = 0.5  # seconds between post starts across all workers, to stay polite
+START_GATE = {"lock": threading.Lock(), "next": 0.0}
+# Set on Ctrl+C so workers stop after their current post instead of draining the queue
+STOP_WORKERS = threading.Event()
+
+def wait_start_gate():
+    """Block until this worker may start its next post (shared WORKER_START_GAP pacing)."""
+    with START_GATE["lock"]:
+        now = time.monotonic()
+        start = max(now, START_GATE["next"])
+        START_GATE["next"] = start + WORKER_START_GAP
+    polite_sleep(start - now)
+
+def run_worker(slot, tasks, results, storage_file, dry_run, username, headless, launch_args, context_options):
+    """
+    Worker thread body: open this slot's browser once, then process hrefs from the
+    tasks queue until the None sentinel (or STOP_WORKERS), putting
+    (href, ok, images_count) on results. Puts None on results when it exits so
+    run_parallel_pass() never waits on a dead worker.
+    Sync Playwright objects can't be shared across threads, and a profile can only
+    be opened once, so each worker slot keeps its own persistent profile next to
+    PROFILE_DIR, seeded from storage_file (cookies and localStorage).
+    Tasks are (href, verify); verify asks for a post_deleted() check after a real
+    deletion, and results carry whether that check found the post still online.
+    """
+    from playwright.sync_api import sync_playwright
+    try:
+        with sync_playwright() as p:
+            context, page = launch_profile_context(
+                p, storage_file, headless, launch_args, block_resources=True,
+                profile_dir=f"{PROFILE_DIR}-worker{slot}", **context_options
+            )
+            try:
+                while True:
+                    task = tasks.get()
+                    if task is None:
+                        break
+                    href, verify = task
+                    wait_start_gate()
+                    if STOP_WORKERS.is_set():
+                        break
+                    log = PostLog()
+                    log.info(f"Processing {href} ...")
+                    still_online = False
+                    try:
+                        ok, images_count = delete_one(page, href, dry_run, username, log=log)
+                        # Ungrouped albums keep their URL, so only deleted images are checked
+                        if verify and ok and images_count and not dry_run:
+                            polite_sleep(0.4)  # Give deletion time to process
+                            still_online = post_deleted(page, "https://imgur.com" + href) is False
+                            if still_online:
+                                log.info(f" {YEL}⚠ Deletion may have failed - post still accessible at https://imgur.com{href}{RESET}")
+                                ok, images_count = False, 0
+                    finally:
+                        log.flush()
+                    results.put((href, ok, images_count, still_online))
+            finally:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+    except Exception as e:
+        print(f"{RED}❌ Worker {slot} stopped: {e}{RESET}")
+    finally:
+        results.put(None)
+
+def start_worker_pool(workers, **worker_args):
+    """
+    Start the worker threads once per run, so each browser cold-starts only once.
+    Returns the pool state used by run_parallel_pass() and stop_worker_pool().
+    """
+    STOP_WORKERS.clear()
+    pool = {"tasks": queue.Queue(), "results": queue.Queue(), "threads": [], "alive": workers}
+    for slot in range(workers):
+        thread = threading.Thread(
+            target=run_worker, args=(slot, pool["tasks"], pool["results"]),
+            kwargs=worker_args, daemon=True,
+        )
+        thread.start()
+        pool["threads"].append(thread)
+    return pool
+
+def run_parallel_pass(pool, hrefs, processed, max_to_process, dry_run, verify_state):
+    """
+    Queue hrefs for the running workers, wait for their results, and return the
+    updated processed count. On Ctrl+C, workers are told to stop, so at most one
+    in-flight post per worker completes.
+    verify_state ({"count", "every"}) is owned by main() so sampling spans passes:
+    every VERIFY_EVERY_N-th post is verified, and every post once a check finds a
+    "deleted" post still online.
+    """
+    batch = hrefs[:max_to_process - processed]
+    for href in batch:
+        verify = verify_state["count"] % verify_state["every"] == 0
+        verify_state["count"] += 1
+        pool["tasks"].put((href, verify))
+    remaining = len(batch)
+    try:
+        while remaining and pool["alive"]:
+            try:
+                # Short timeout keeps Ctrl+C responsive on platforms where a blocking get isn't
+                item = pool["results"].get(timeout=1)
+            except queue.Empty:
+                continue
+            if item is None:
+                pool["alive"] -= 1
+                continue
+            href, ok, images_count, still_online = item
+            if still_online:
+                verify_state["every"] = 1  # Something regressed; check every post from here on
+            remaining -= 1
+            processed = record_result(ok, images_count, processed, dry_run)
+    except KeyboardInterrupt:
+        STOP_WORKERS.set()
+        raise
+    if not pool["alive"]:
+        raise RuntimeError("all parallel workers stopped")
+    return processed
+
+def stop_worker_pool(pool):
+    """Send each worker its sentinel and wait for the threads (and browsers) to finish."""
+    for _ in pool["threads"]:
+        pool["tasks"].put(None)
+    for thread in pool["threads"]:
+        thread.join()
+
+def main(workers=None):
     try:
         # Interactive setup
         username, storage_file, dry_run, max_to_process, headless = interactive_setup()
+        if workers is None:
+            # Dry runs never write server-side, so they parallelize safely by default
+            workers = 4 if dry_run else 1
         
         print_banner(username, dry_run, max_to_process, headless)
     except KeyboardInterrupt:
@@ -1029,6 +1501,7 @@ def main():
         if not Path(storage_file).exists():
             raise SystemExit(f"{RED}Missing {storage_file}. Run your login script first.{RESET}")
 
+        from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
             # Add stealth-like args to reduce detection (apply to both headless and headful)
             launch_args = {
@@ -1036,21 +1509,23 @@ def main():
                     "--disable-blink-features=AutomationControlled",
                 ]
             }
-            # Add headless-specific args
+            # Add headless-specific args (nothing is rendered on screen, so skip the
+            # GPU process and other background services for a faster cold start).
+            # Playwright already launches with chromium_sandbox=False by default.
             if headless:
-                launch_args["args"].append("--disable-dev-shm-usage")
-            browser = p.chromium.launch(headless=headless, **launch_args)
-            
+                launch_args["args"].extend(HEADLESS_LAUNCH_ARGS)
             # Set a more realistic viewport and user agent
-            context = browser.new_context(
-                storage_state=storage_file,
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            context_options = {
+                "viewport": {"width": 1920, "height": 1080},
+                "user_agent": USER_AGENT,
+            }
+            context, page = launch_profile_context(
+                p, storage_file, headless, launch_args["args"], block_resources=True, **context_options
             )
-            page = context.new_page()
 
             processed = 0
-            seen_heights = set()
+            worker_pool = None  # started on the first parallel pass, reused for the rest of the run
+            verify_state = {"count": 0, "every": VERIFY_EVERY_N}  # parallel verify sampling
 
             try:
                 # Validate session at startup
@@ -1065,12 +1540,9 @@ def main():
                     if not relogin_and_update_session(storage_file):
                         raise SystemExit(f"{RED}Could not re-authenticate. Exiting.{RESET}")
                     # Recreate context with updated storage state
-                    context = browser.new_context(
-                        storage_state=storage_file,
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                    context, page = launch_profile_context(
+                        p, storage_file, headless, launch_args["args"], block_resources=True, **context_options
                     )
-                    page = context.new_page()
                     # Re-validate after re-login
                     if not validate_session(page, username):
                         raise SystemExit(f"{RED}Session still invalid after re-login. Exiting.{RESET}")
@@ -1091,78 +1563,115 @@ def main():
                     if not relogin_and_update_session(storage_file):
                         raise SystemExit(f"{RED}Could not re-authenticate. Exiting.{RESET}")
                     # Recreate context with updated storage state
-                    context = browser.new_context(
-                        storage_state=storage_file,
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                    context, page = launch_profile_context(
+                        p, storage_file, headless, launch_args["args"], block_resources=True, **context_options
                     )
-                    page = context.new_page()
                     go_to_posts_all(page, username)
                 
                 scroll_to_top(page)
 
+                # Two post tabs: one runs delete_one() while the other preloads the next href
+                post_pages = None
+                # Hrefs already handed out this run; persists across scroll passes
+                seen_hrefs = set()
+                grid_url = get_posts_url(username).lower()
+                # Set once a real deletion leaves stale tiles on the grid tab
+                needs_refresh = False
+                # Deleted hrefs awaiting a batched verify_deleted() check, and those it
+                # found still online (reported again at the end of the run)
+                pending_verify = []
+                survivors = []
+
                 while processed < max_to_process:
-                    links = find_post_links_sorted(page)
-                    if not links:
+                    # Deletions happen in the post tabs, so the grid tab normally never leaves
+                    # the grid; the URL check is a cheap guard instead of a navigation per post.
+                    # Lowercased: the detected username may differ in case from Imgur's canonical URL
+                    if not page.url.lower().startswith(grid_url):
+                        go_to_posts_all(page, username)
+                    link_iter = iter_post_links(page, seen_hrefs)
+                    pending = next(link_iter, None)
+                    preloaded_href = None
+                    if pending is None:
                         # Try to load more via infinite scroll
-                        last_h = page.evaluate("() => document.body.scrollHeight")
-                        if last_h in seen_heights:
+                        if not scroll_for_more(page):
                             print("No more posts found. Exiting.")
                             break
-                        seen_heights.add(last_h)
-                        page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
-                        polite_sleep(0.8)  # Give content time to load after scrolling
                         continue
 
-                    for href, x, y in links:
-                        print(f"Processing {href} at ({int(x)},{int(y)}) ...")
-                        ok, images_count = delete_one(page, href, dry_run, username)
-                        if ok:
-                            # Albums (images_count == 0) count as 1 item processed
-                            if images_count == 0:
-                                processed += 1
-                                print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} post (total: {processed})")
+                    if workers > 1:
+                        if worker_pool is None:
+                            worker_pool = start_worker_pool(
+                                workers, storage_file=storage_file, dry_run=dry_run, username=username,
+                                headless=headless, launch_args=launch_args["args"],
+                                context_options=context_options,
+                            )
+                        processed = run_parallel_pass(
+                            worker_pool, [pending[0]] + [href for href, x, y in link_iter],
+                            processed, max_to_process, dry_run, verify_state,
+                        )
+                        # Workers use their own tabs, so this grid and its links are
+                        # still current unless posts were really deleted
+                        needs_refresh = not dry_run
+                    else:
+                        while pending is not None:
+                            href, x, y = pending
+                            pending = next(link_iter, None)  # one-item lookahead for preloading
+                            if post_pages is None:
+                                post_pages = [context.new_page(), context.new_page()]
+                                preloaded_href = None
+                            cur_page, next_page = post_pages
+                            next_href = pending[0] if pending is not None else None
+                            if next_href and processed + 1 < max_to_process:
+                                start_navigation(next_page, "https://imgur.com" + next_href)
                             else:
-                                processed += images_count  # Add actual number of images deleted
-                                if images_count == 1:
-                                    print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} image (total: {processed})")
-                                else:
-                                    print(f" -> {'Simulated' if dry_run else (GRN + 'Deleted' + RESET)} {images_count} image(s) (total: {processed})")
-                        else:
-                            processed += 1  # Count attempt even if failed
-                            print(f" -> {YEL}Failed{RESET} (total attempts: {processed})")
+                                next_href = None
+                            where = f" at ({int(x)},{int(y)})" if x is not None else ""
+                            log = PostLog()
+                            log.info(f"Processing {href}{where} ...")
+                            try:
+                                ok, images_count = delete_one(
+                                    cur_page, href, dry_run, username,
+                                    preloaded=(preloaded_href == href), log=log,
+                                )
+                            finally:
+                                log.flush()
+                            preloaded_href = next_href
+                            post_pages.reverse()
+                            processed = record_result(ok, images_count, processed, dry_run)
+                            if ok and not dry_run:
+                                needs_refresh = True
+                                if images_count:  # Ungrouped albums keep their URL
+                                    pending_verify.append(href)
+                                    if len(pending_verify) >= VERIFY_BATCH_SIZE:
+                                        # post_pages[1] is the tab just used; [0] is preloading
+                                        survivors += verify_deleted(page, pending_verify, post_pages[1])
+                                        pending_verify = []
 
-                        polite_sleep(0.1)
+                            polite_sleep(0.1)
 
-                        # Always return to grid and ensure All tab; go back to top for stable order
-                        go_to_posts_all(page, username)
-                        
-                        # Check for auth failures after navigation
-                        if detect_auth_failure(page):
-                            print(f"\n{YEL}⚠️  Session expired during execution.{RESET}")
-                            # Close current context before re-login
-                            try:
-                                context.close()
-                            except Exception:
-                                pass
-                            if not relogin_and_update_session(storage_file):
-                                print(f"{RED}Could not re-authenticate. Stopping execution.{RESET}")
+                            # Stay on the grid and keep consuming this pass's links; the post
+                            # tab just used shows whether the session is still valid.
+                            if detect_auth_failure(cur_page):
+                                print(f"\n{YEL}⚠️  Session expired during execution.{RESET}")
+                                # Close current context before re-login
+                                try:
+                                    context.close()
+                                except Exception:
+                                    pass
+                                if not relogin_and_update_session(storage_file):
+                                    print(f"{RED}Could not re-authenticate. Stopping execution.{RESET}")
+                                    break
+                                # Recreate context with updated storage state
+                                context, page = launch_profile_context(
+                                    p, storage_file, headless, launch_args["args"], block_resources=True, **context_options
+                                )
+                                post_pages = None
+                                go_to_posts_all(page, username)
+                                scroll_to_top(page)
+                                print(f"{GRN}✓ Resumed execution with fresh session.{RESET}\n")
+
+                            if processed >= max_to_process:
                                 break
-                            # Recreate context with updated storage state
-                            context = browser.new_context(
-                                storage_state=storage_file,
-                                viewport={"width": 1920, "height": 1080},
-                                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                            )
-                            page = context.new_page()
-                            go_to_posts_all(page, username)
-                            scroll_to_top(page)
-                            print(f"{GRN}✓ Resumed execution with fresh session.{RESET}\n")
-                        else:
-                            scroll_to_top(page)
-
-                        if processed >= max_to_process:
-                            break
 
                     # Attempt to pull more items for the next pass
                     # Check for auth failure before scrolling
@@ -1177,39 +1686,52 @@ def main():
                             print(f"{RED}Could not re-authenticate. Stopping execution.{RESET}")
                             break
                         # Recreate context with updated storage state
-                        context = browser.new_context(
-                            storage_state=storage_file,
-                            viewport={"width": 1920, "height": 1080},
-                            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                        context, page = launch_profile_context(
+                            p, storage_file, headless, launch_args["args"], block_resources=True, **context_options
                         )
-                        page = context.new_page()
+                        post_pages = None
                         go_to_posts_all(page, username)
                         scroll_to_top(page)
                         print(f"{GRN}✓ Resumed execution with fresh session.{RESET}\n")
                         continue  # Skip scrolling, go back to find links
+
+                    if needs_refresh:
+                        # Reload the grid once per pass (not per post) to drop deleted tiles
+                        needs_refresh = False
+                        go_to_posts_all(page, username)
+                        scroll_to_top(page)
+                        continue
                     
-                    last_h = page.evaluate("() => document.body.scrollHeight")
-                    if last_h in seen_heights:
+                    if not scroll_for_more(page):
                         print("No further content loaded. Finished.")
                         break
-                    seen_heights.add(last_h)
-                    page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
-                    polite_sleep(0.8)  # Give content time to load after scrolling
 
+                survivors += verify_deleted(page, pending_verify, post_pages[1] if post_pages else None)
                 print(f"\n{GRN}✅ Done. {'Simulated' if dry_run else 'Actual'} items processed: {processed}{RESET}")
+                if survivors:
+                    print(f"{YEL}⚠ {len(survivors)} post(s) reported as deleted are still online:{RESET}")
+                    for href in survivors:
+                        print(f"   https://imgur.com{href}")
 
             except KeyboardInterrupt:
                 print(f"\n{YEL}⛔ Interrupted by user.{RESET} {'Simulated' if dry_run else 'Actual'} items processed: {processed}")
             finally:
                 # Suppress all exceptions (including KeyboardInterrupt) during cleanup
+                if worker_pool is not None:
+                    try:
+                        stop_worker_pool(worker_pool)
+                    except (KeyboardInterrupt, Exception):
+                        pass
+                if not dry_run:
+                    # Keep cookies Imgur rotated during the run so the next start skips login
+                    try:
+                        context.storage_state(path=storage_file)
+                    except (KeyboardInterrupt, Exception):
+                        pass
                 try:
                     context.close()
                 except (KeyboardInterrupt, Exception):
                     pass
-                try:
-                    browser.close()
-                except (KeyboardInterrupt, Exception):
-                    pass
                 print(f"{BLU}Browser closed. Exiting cleanly.{RESET}")
     except KeyboardInterrupt:
         print(f"\n\n{YEL}⛔ Interrupted by user. Exiting.{RESET}")
@@ -1219,4 +1741,12 @@ def main():
         print(f"\n{RED}❌ Error: {e}{RESET}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Bulk delete Imgur posts.")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="parallel browser contexts (default: 4 for dry runs, 1 for real deletions)",
+    )
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    main(workers=args.workers)